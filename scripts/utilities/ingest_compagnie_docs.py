@@ -4,6 +4,7 @@ import argparse
 import hashlib
 import json
 import logging
+import mmap
 import os
 import re
 import shutil
@@ -14,6 +15,7 @@ from pathlib import Path
 from typing import Any
 from urllib.parse import unquote_plus
 
+import orjson
 import requests
 
 
@@ -24,6 +26,14 @@ PROCESSED_DIR_NAME = "processed"
 PDF_MARKDOWN_DIR = "pdf_markdown"
 PDF_JSON_DIR = "pdf_json"
 FIG_EXPORTS_DIR = "fig_exports"
+STAT_CACHE_FILE_NAME = "stat_cache.json"
+# Machine-local (mtimes), so it lives outside the committed corpus.
+STAT_CACHE_DIR = Path(".cache") / "compagnie_docs"
+# Files modified this close to the cache write may have changed again within
+# the same timestamp tick; FAT stores mtimes with 2 s resolution.
+STAT_CACHE_RACY_WINDOW_NS = 2_000_000_000
+# Below this size, mapping the file costs more than reading it.
+MMAP_HASH_MIN_BYTES = 64 * 1024
 logger = logging.getLogger(__name__)
 
 
@@ -39,11 +49,57 @@ def _slugify(value: str) -> str:
 
 
 def _sha256_file(path: Path) -> str:
-    digest = hashlib.sha256()
     with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
+        if os.fstat(handle.fileno()).st_size >= MMAP_HASH_MIN_BYTES:
+            # Hash straight from the page cache; no copy into a read buffer.
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return hashlib.sha256(mapped).hexdigest()
+        # file_digest streams through one reusable buffer instead of
+        # allocating a bytes object per chunk.
+        return hashlib.file_digest(handle, "sha256").hexdigest()
+
+
+def _load_stat_cache(path: Path) -> tuple[dict[str, dict[str, Any]], int]:
+    """Return the cached entries and the time the cache was written."""
+    if not path.exists():
+        return {}, 0
+    try:
+        written_ns = path.stat().st_mtime_ns
+        payload = orjson.loads(path.read_bytes())
+    except (OSError, ValueError):
+        logger.warning("Ignoring unreadable stat cache: %s", path)
+        return {}, 0
+    return (payload, written_ns) if isinstance(payload, dict) else ({}, 0)
+
+
+def _sha256_with_stat_cache(
+    file_path: Path,
+    cache_key: str,
+    stat_result: os.stat_result,
+    previous_cache: dict[str, dict[str, Any]],
+    previous_written_ns: int,
+    next_cache: dict[str, dict[str, Any]],
+) -> str:
+    # A file whose size and mtime match the previous run is not re-read,
+    # unless it was modified so close to that run that a same-size rewrite
+    # could share its mtime.
+    entry = previous_cache.get(cache_key)
+    if (
+        isinstance(entry, dict)
+        and entry.get("size") == stat_result.st_size
+        and entry.get("mtime_ns") == stat_result.st_mtime_ns
+        and stat_result.st_mtime_ns + STAT_CACHE_RACY_WINDOW_NS <= previous_written_ns
+        and entry.get("sha256")
+    ):
+        sha256 = str(entry["sha256"])
+    else:
+        sha256 = _sha256_file(file_path)
+    next_cache[cache_key] = {
+        "size": stat_result.st_size,
+        "mtime_ns": stat_result.st_mtime_ns,
+        "sha256": sha256,
+    }
+    return sha256
 
 
 def _backup_if_exists(path: Path) -> Path | None:
@@ -57,7 +113,7 @@ def _backup_if_exists(path: Path) -> Path | None:
 
 def _write_json(path: Path, payload: Any) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+    path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
 
 
 def _write_text(path: Path, content: str) -> None:
@@ -323,7 +379,7 @@ def _resolve_figma_key_map() -> dict[str, str]:
     if not path.exists():
         return {}
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = orjson.loads(path.read_bytes())
     except Exception:
         return {}
     if not isinstance(data, dict):
@@ -467,6 +523,7 @@ def ingest_compagnie_docs(
     *,
     mode: str = "full",
     enable_figma_export: bool = True,
+    stat_cache_path: str | Path | None = None,
 ) -> dict[str, Any]:
     repo_root = _repo_root()
     source = Path(source_dir).expanduser().resolve()
@@ -487,6 +544,11 @@ def ingest_compagnie_docs(
 
     index_json_path = index_dir / "corpus_index.json"
     index_md_path = index_dir / "corpus_index.md"
+    if stat_cache_path is None:
+        stat_cache_path = repo_root / STAT_CACHE_DIR / STAT_CACHE_FILE_NAME
+    stat_cache_path = Path(stat_cache_path).expanduser().resolve()
+    previous_stat_cache, previous_stat_cache_written_ns = _load_stat_cache(stat_cache_path)
+    next_stat_cache: dict[str, dict[str, Any]] = {}
 
     source_files = sorted(
         [
@@ -516,8 +578,16 @@ def ingest_compagnie_docs(
         normalized_name = _slugify(file_path.stem)
         # By default, do not replace underscores with apostrophes to avoid breaking paths
         original_name = _normalize_original_name(file_path.name, replace_embedded_apostrophes=False)
-        sha256 = _sha256_file(file_path)
         source_path = _path_to_repo_relative_posix(file_path, repo_root)
+        file_stat = file_path.stat()
+        sha256 = _sha256_with_stat_cache(
+            file_path,
+            source_path,
+            file_stat,
+            previous_stat_cache,
+            previous_stat_cache_written_ns,
+            next_stat_cache,
+        )
 
         if sha256 in dedupe_hash_to_doc:
             canonical = dedupe_hash_to_doc[sha256]
@@ -526,7 +596,7 @@ def ingest_compagnie_docs(
                 "original_name": original_name,
                 "normalized_name": normalized_name,
                 "ext": ext,
-                "size_bytes": file_path.stat().st_size,
+                "size_bytes": file_stat.st_size,
                 "sha256": sha256,
                 "source_path": source_path,
                 "raw_path": canonical["raw_path"],
@@ -551,7 +621,7 @@ def ingest_compagnie_docs(
             "original_name": original_name,
             "normalized_name": normalized_name,
             "ext": ext,
-            "size_bytes": file_path.stat().st_size,
+            "size_bytes": file_stat.st_size,
             "sha256": sha256,
             "source_path": source_path,
             "raw_path": raw_path_str,
@@ -655,6 +725,7 @@ def ingest_compagnie_docs(
     _backup_if_exists(index_md_path)
     _write_json(index_json_path, index_payload)
     _write_text(index_md_path, _render_index_markdown(index_payload))
+    _write_json(stat_cache_path, next_stat_cache)
     return index_payload
 
 
@@ -681,6 +752,11 @@ def _build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Disable remote Figma API export attempts for .fig files.",
     )
+    parser.add_argument(
+        "--stat-cache",
+        default=None,
+        help="File used to skip re-hashing unchanged sources (default: .cache/compagnie_docs/stat_cache.json).",
+    )
     return parser
 
 
@@ -692,6 +768,7 @@ def main() -> int:
         target_dir=args.target,
         mode="full" if args.mode == "full" else "copy-only",
         enable_figma_export=not args.disable_figma_export,
+        stat_cache_path=args.stat_cache,
     )
     print("CompagnieDocs ingestion complete.")
     print(json.dumps(result["stats"], indent=2))
@@ -19,7 +19,7 @@ from typing import Annotated, Any
 from fastapi import APIRouter, Depends, FastAPI, File, Form, HTTPException, Query, UploadFile, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, JSONResponse, PlainTextResponse, Response
+from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse, PlainTextResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel, EmailStr, Field, field_validator
@@ -237,6 +237,7 @@ NOTIFICATION_EVENT_KEYS = {
 }
 REPORT_FREQUENCIES = {"daily", "weekly", "monthly"}
 REPORT_FORMATS = {"pdf", "csv"}
+LEAD_BUNDLE_SECTIONS = ("notes", "opportunities", "interactions", "history", "tasks", "projects")
 SYNC_STALE_WARNING_SECONDS = 5 * 60
 SYNC_STALE_ERROR_SECONDS = 30 * 60
 INTEGRITY_STALE_UNSCORED_DAYS = 14
@@ -451,6 +452,10 @@ class AdminOpportunityQuickLeadRequest(BaseModel):
     company_name: str = Field(min_length=1)
 
 
+class AdminOpportunityQuickLeadBulkRequest(BaseModel):
+    items: list[AdminOpportunityQuickLeadRequest] = Field(min_length=1, max_length=100)
+
+
 class AdminLeadNoteItemPayload(BaseModel):
     id: str | None = None
     content: str = Field(min_length=1)
@@ -3292,6 +3297,16 @@ def _list_lead_opportunities_payload(db: Session, *, lead_id: str) -> list[dict[
     return [_serialize_opportunity(row) for row in rows]
 
 
+def _list_lead_tasks_payload(db: Session, *, lead_id: str) -> list[dict[str, Any]]:
+    tasks = db.query(DBTask).filter(DBTask.lead_id == lead_id).order_by(DBTask.created_at.desc()).all()
+    return [_serialize_task(task) for task in tasks]
+
+
+def _list_lead_projects_payload(db: Session, *, lead_id: str) -> list[dict[str, Any]]:
+    projects = db.query(DBProject).filter(DBProject.lead_id == lead_id).order_by(DBProject.created_at.desc()).all()
+    return [_serialize_project(project) for project in projects]
+
+
 def _create_lead_opportunity_payload(
     db: Session,
     *,
@@ -3813,11 +3828,67 @@ def _quick_create_opportunity_lead_payload(
     return {"created": True, "lead": _serialize_opportunity_prospect_summary(created_lead)}
 
 
+def _quick_create_opportunity_leads_bulk_payload(
+    db: Session,
+    payload: AdminOpportunityQuickLeadBulkRequest,
+) -> dict[str, Any]:
+    # Items are applied in order, so a repeated email resolves to the lead
+    # created earlier in the same batch. Each lead is committed on its own; an
+    # item that fails is reported in place instead of hiding the ones already
+    # committed behind an error response. Every item carries ``error``, which
+    # is None unless that item failed.
+    items: list[dict[str, Any]] = []
+    for item in payload.items:
+        try:
+            items.append({**_quick_create_opportunity_lead_payload(db, item), "error": None})
+        except HTTPException as exc:
+            items.append({"created": False, "lead": None, "error": exc.detail})
+    return {
+        "items": items,
+        "created_count": sum(1 for item in items if item.get("created")),
+        "failed_count": sum(1 for item in items if item.get("error")),
+    }
+
+
 def _list_lead_notes_payload(db: Session, *, lead_id: str) -> dict[str, Any]:
     db_lead = _get_lead_or_404(db, lead_id)
     return {"items": _lead_notes_from_details(db_lead.details)}
 
 
+def _build_lead_bundle_payload(
+    db: Session,
+    *,
+    lead_id: str,
+    include: str | None,
+    window: str = "30d",
+) -> dict[str, Any]:
+    sections = [part.strip().lower() for part in (include or "").split(",") if part.strip()]
+    if not sections:
+        sections = list(LEAD_BUNDLE_SECTIONS)
+    unknown = [section for section in sections if section not in LEAD_BUNDLE_SECTIONS]
+    if unknown:
+        raise HTTPException(
+            status_code=HTTP_422_STATUS,
+            detail=f"Unsupported bundle section: {', '.join(unknown)}",
+        )
+
+    _get_lead_or_404(db, lead_id)
+    payload: dict[str, Any] = {"lead_id": lead_id}
+    if "notes" in sections:
+        payload["notes"] = _list_lead_notes_payload(db, lead_id=lead_id)
+    if "opportunities" in sections:
+        payload["opportunities"] = _list_lead_opportunities_payload(db, lead_id=lead_id)
+    if "interactions" in sections:
+        payload["interactions"] = _list_lead_interactions_payload(db, lead_id=lead_id)
+    if "history" in sections:
+        payload["history"] = _build_lead_history_payload(db, lead_id=lead_id, window=window)
+    if "tasks" in sections:
+        payload["tasks"] = _list_lead_tasks_payload(db, lead_id=lead_id)
+    if "projects" in sections:
+        payload["projects"] = _list_lead_projects_payload(db, lead_id=lead_id)
+    return payload
+
+
 def _save_lead_notes_payload(
     db: Session,
     *,
@@ -6624,6 +6695,7 @@ def create_app() -> FastAPI:
         title="Prospect Admin Dashboard",
         version="1.0.0",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
     _init_admin_db()
     app.add_middleware(
@@ -7544,16 +7616,14 @@ def create_app() -> FastAPI:
         lead_id: str,
         db: Session = Depends(get_db),
     ) -> list[dict[str, Any]]:
-        tasks = db.query(DBTask).filter(DBTask.lead_id == lead_id).order_by(DBTask.created_at.desc()).all()
-        return [_serialize_task(task) for task in tasks]
+        return _list_lead_tasks_payload(db, lead_id=lead_id)
 
     @admin_v1.get("/leads/{lead_id}/projects")
     def get_lead_projects_v1(
         lead_id: str,
         db: Session = Depends(get_db),
     ) -> list[dict[str, Any]]:
-        projects = db.query(DBProject).filter(DBProject.lead_id == lead_id).order_by(DBProject.created_at.desc()).all()
-        return [_serialize_project(project) for project in projects]
+        return _list_lead_projects_payload(db, lead_id=lead_id)
 
     @admin_v1.get("/leads/{lead_id}/communication-plan")
     def get_lead_communication_plan_v1(
@@ -7602,6 +7672,15 @@ def create_app() -> FastAPI:
     ) -> dict[str, Any]:
         return _build_lead_history_payload(db, lead_id=lead_id, window=window)
 
+    @admin_v1.get("/leads/{lead_id}/bundle")
+    def get_lead_bundle_v1(
+        lead_id: str,
+        include: str | None = Query(default=None),
+        window: str = Query(default="30d"),
+        db: Session = Depends(get_db),
+    ) -> dict[str, Any]:
+        return _build_lead_bundle_payload(db, lead_id=lead_id, include=include, window=window)
+
     @admin_v1.post("/leads/{lead_id}/send-email")
     def send_lead_email_v1(
         lead_id: str,
@@ -8048,6 +8127,28 @@ def create_app() -> FastAPI:
             )
         return result
 
+    @admin_v1.post("/opportunities/quick-lead/bulk")
+    def create_opportunity_quick_leads_bulk_v1(
+        payload: AdminOpportunityQuickLeadBulkRequest,
+        actor: str = "admin",
+        db: Session = Depends(get_db),
+    ) -> dict[str, Any]:
+        result = _quick_create_opportunity_leads_bulk_payload(db, payload)
+        _audit_log(
+            db,
+            actor=actor,
+            action="opportunity_quick_lead_bulk",
+            entity_type="lead",
+            entity_id="bulk",
+            metadata={
+                "requested": len(payload.items),
+                "created": result["created_count"],
+                "failed": result["failed_count"],
+                "lead_ids": [item["lead"]["id"] for item in result["items"] if item.get("lead")],
+            },
+        )
+        return result
+
     @admin_v1.post("/opportunities")
     def create_opportunity_v1(
         payload: AdminOpportunityCreateRequest,
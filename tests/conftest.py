@@ -1,32 +1,73 @@
 from __future__ import annotations
 
+import base64
+import importlib
+import itertools
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+# Under pytest-xdist every worker imports the app in its own process; point
+# each one at a private SQLite file so module-level app setup and tests that
+# use the default engine never contend for the same database.
+# The run id keeps concurrent runs on one host apart; the file is removed
+# again in pytest_sessionfinish.
+_XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+_WORKER_DB_PATH: Path | None = None
+if _XDIST_WORKER:
+    _run_id = os.environ.get("PYTEST_XDIST_TESTRUNUID", str(os.getpid()))
+    _WORKER_DB_PATH = Path(tempfile.gettempdir()) / f"prospect_test_{_run_id}_{_XDIST_WORKER}.db"
+    os.environ["DATABASE_URL"] = f"sqlite:///{_WORKER_DB_PATH.as_posix()}"
+
+import httpx
 import pytest
+import requests
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from requests.adapters import HTTPAdapter
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
 
+from src.admin import secrets_manager as secrets_module
 from src.admin.app import app
+from src.core import database as database_module
 from src.core.database import Base, get_db
 
 
-@pytest.fixture
-def db_session(tmp_path):
-    db_path = tmp_path / "test.db"
-    engine = create_engine(
-        f"sqlite:///{db_path}",
-        connect_args={"check_same_thread": False},
-    )
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    Base.metadata.create_all(bind=engine)
-    session = TestingSessionLocal()
-    try:
-        yield session
-    finally:
-        session.close()
+ADMIN_AUTH_HEADERS = {"Authorization": "Basic " + base64.b64encode(b"admin:secret").decode("ascii")}
 
+# The verify_*.py modules run against a server started separately, e.g.
+# ``pytest tests/verify_filters.py``; they are not collected by default.
+LIVE_SERVER_URL = "http://localhost:8000"
+LIVE_ADMIN_AUTH = ("admin", "change-me")
 
-@pytest.fixture
-def client(db_session, monkeypatch):
+
+def pytest_sessionfinish(session, exitstatus):
+    if _WORKER_DB_PATH is not None:
+        # Release the app's pooled connections first so the file can be
+        # deleted on Windows as well.
+        database_module.engine.dispose()
+        _WORKER_DB_PATH.unlink(missing_ok=True)
+
+
+def _memory_engine(connection: sqlite3.Connection | None = None):
+    # A single shared in-memory connection keeps every session in the test on
+    # the same database without touching the filesystem. Callers create the
+    # schema once any engine listeners are in place.
+    if connection is None:
+        return create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+    return create_engine("sqlite://", creator=lambda: connection, poolclass=StaticPool)
+
+
+def _set_admin_env(monkeypatch) -> None:
     monkeypatch.setenv("ADMIN_USERNAME", "admin")
     monkeypatch.setenv("ADMIN_PASSWORD", "secret")
     monkeypatch.setenv("ADMIN_AUTH_MODE", "hybrid")
@@ -34,6 +75,98 @@ def client(db_session, monkeypatch):
     monkeypatch.setenv("AUTH_COOKIE_SECURE", "false")
     monkeypatch.setenv("APP_ENCRYPTION_KEY", "UsC5jE10lKM1nWQihuyqLpifqarK3WftO0ombGi9HzE=")
 
+
+@pytest.fixture(scope="session")
+def db_engine():
+    engine = _memory_engine()
+
+    # pysqlite opens transactions lazily and does not emit SAVEPOINT on its
+    # own; take over BEGIN so nested transactions behave as in other drivers.
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, _connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
+    # StaticPool opens its only connection here, after the listeners exist.
+    Base.metadata.create_all(bind=engine)
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+
+
+@contextmanager
+def _rolled_back_session(engine):
+    # Work runs inside an outer transaction that is rolled back on exit;
+    # commits made by the app only release a SAVEPOINT.
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, autoflush=False, join_transaction_mode="create_savepoint")
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture
+def db_session(db_engine):
+    with _rolled_back_session(db_engine) as session:
+        yield session
+
+
+@pytest.fixture(scope="session")
+def app_client():
+    with pytest.MonkeyPatch.context() as session_monkeypatch:
+        _set_admin_env(session_monkeypatch)
+        session_monkeypatch.setattr(secrets_module, "secrets_manager", secrets_module.SecretsManager())
+        with TestClient(app) as test_client:
+            yield test_client
+
+
+@pytest.fixture(scope="session")
+def static_get(app_client, db_engine):
+    """Fetch seed-derived, read-only admin payloads once per session."""
+    cache: dict[str, dict] = {}
+
+    def fetch(path: str) -> dict:
+        if path not in cache:
+            previous = app.dependency_overrides.get(get_db)
+            with _rolled_back_session(db_engine) as session:
+
+                def override_get_db():
+                    yield session
+
+                app.dependency_overrides[get_db] = override_get_db
+                try:
+                    response = app_client.get(path, headers=ADMIN_AUTH_HEADERS)
+                finally:
+                    if previous is None:
+                        app.dependency_overrides.pop(get_db, None)
+                    else:
+                        app.dependency_overrides[get_db] = previous
+            assert response.status_code == 200, response.text
+            cache[path] = response.json()
+        return cache[path]
+
+    return fetch
+
+
+@pytest.fixture
+def admin_auth(app_client):
+    """Send the admin Basic credentials on every request of the test."""
+    app_client.headers.update(ADMIN_AUTH_HEADERS)
+    yield
+    for header in ADMIN_AUTH_HEADERS:
+        app_client.headers.pop(header, None)
+
+
+@pytest.fixture
+def client(app_client, db_session):
     def override_get_db():
         try:
             yield db_session
@@ -41,6 +174,169 @@ def client(db_session, monkeypatch):
             pass
 
     app.dependency_overrides[get_db] = override_get_db
-    with TestClient(app) as test_client:
-        yield test_client
+    yield app_client
     app.dependency_overrides.clear()
+    app_client.cookies.clear()
+
+
+@pytest.fixture
+def app_factory(client, monkeypatch):
+    """Return the admin client with process state rebuilt under ``env``.
+
+    A ``None`` value unsets the variable. State the app reads once at
+    startup, such as the secrets manager's encryption key, is rebuilt after
+    the environment is applied so the client behaves as if booted with it.
+    """
+
+    def build(env: dict[str, str | None]) -> TestClient:
+        for key, value in env.items():
+            if value is None:
+                monkeypatch.delenv(key, raising=False)
+            else:
+                monkeypatch.setenv(key, value)
+        monkeypatch.setattr(secrets_module, "secrets_manager", secrets_module.SecretsManager())
+        return client
+
+    return build
+
+
+@pytest.fixture(scope="session")
+def template_db():
+    """Empty database with the full schema, built once per session."""
+    connection = sqlite3.connect(":memory:", check_same_thread=False)
+    engine = _memory_engine(connection)
+    Base.metadata.create_all(bind=engine)
+    try:
+        yield connection
+    finally:
+        engine.dispose()
+        connection.close()
+
+
+@pytest.fixture
+def fresh_db_session(template_db):
+    # Tests asserting exact totals get a database nobody else has written to,
+    # copied page by page from the template instead of re-running the DDL.
+    connection = sqlite3.connect(":memory:", check_same_thread=False)
+    template_db.backup(connection)
+    engine = _memory_engine(connection)
+    FreshSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    session = FreshSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+@pytest.fixture
+def fresh_client(app_client, fresh_db_session):
+    FreshSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=fresh_db_session.get_bind())
+
+    def override_get_db():
+        db = FreshSessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    yield app_client
+    app.dependency_overrides.clear()
+    app_client.cookies.clear()
+
+
+@pytest.fixture(scope="session")
+def ingest_module():
+    """The CompagnieDocs ingestion script, imported once per session.
+
+    Going through the regular import system leaves it in ``sys.modules``, so
+    tests importing it by name share the same module object.
+    """
+    return importlib.import_module("scripts.utilities.ingest_compagnie_docs")
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+def asgi_transport():
+    return httpx.ASGITransport(app=app)
+
+
+def _serialized_get_db(session_factory):
+    # Every session here runs on one in-memory SQLite connection, which is
+    # not safe to drive from two threads at once. Concurrently awaited
+    # requests therefore take turns: each holds the lock from the moment its
+    # session is opened until the dependency is torn down.
+    lock = threading.Lock()
+
+    def override_get_db():
+        with lock:
+            db = session_factory()
+            try:
+                yield db
+            finally:
+                db.close()
+
+    return override_get_db
+
+
+@pytest.fixture
+async def fresh_async_client(fresh_client, fresh_db_session, asgi_transport):
+    FreshSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=fresh_db_session.get_bind())
+    app.dependency_overrides[get_db] = _serialized_get_db(FreshSessionLocal)
+    async with httpx.AsyncClient(
+        transport=asgi_transport,
+        base_url="http://testserver",
+        headers=ADMIN_AUTH_HEADERS,
+    ) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def live_server_url():
+    """Base URL of the running dev server; skips when nothing is listening."""
+    try:
+        requests.get(f"{LIVE_SERVER_URL}/healthz", timeout=2)
+    except requests.ConnectionError:
+        pytest.skip(f"no server running at {LIVE_SERVER_URL}")
+    return LIVE_SERVER_URL
+
+
+@pytest.fixture(scope="session")
+def live_run_id():
+    """Prefix of every id a live run creates, so its rows can be searched for."""
+    return f"{time.time_ns():x}"
+
+
+@pytest.fixture(scope="session")
+def unique_suffix(live_run_id):
+    # Unique per run without drawing on the OS entropy pool for every id.
+    counter = itertools.count()
+
+    def next_suffix() -> str:
+        return f"{live_run_id}{next(counter):x}"
+
+    return next_suffix
+
+
+@pytest.fixture(scope="session")
+def live_session(live_server_url):
+    # One pooled, pre-authenticated session keeps the connection to the
+    # server open across every live check.
+    with requests.Session() as session:
+        session.auth = LIVE_ADMIN_AUTH
+        session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=10, max_retries=0))
+        yield session
+
+
+@pytest.fixture
+async def live_async_client(live_server_url):
+    async with httpx.AsyncClient(
+        base_url=f"{live_server_url}/api/v1/admin",
+        auth=LIVE_ADMIN_AUTH,
+    ) as test_client:
+        yield test_client
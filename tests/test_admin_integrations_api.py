@@ -16,13 +16,15 @@ def test_integrations_put_and_get(client):
     assert put_response.status_code == 200
     providers = put_response.json()["providers"]
     assert providers["slack"]["enabled"] is True
-    assert providers["zapier"]["enabled"] is False
     assert providers["slack"]["config"]["webhook"] == "********"
+    assert providers["zapier"]["enabled"] is False
+    assert providers["zapier"]["config"]["zap_id"] == "zap-1"
 
     get_response = client.get("/api/v1/admin/integrations", auth=("admin", "secret"))
     assert get_response.status_code == 200
-    assert "slack" in get_response.json()["providers"]
-    assert get_response.json()["providers"]["slack"]["config"]["webhook"] == "********"
+    providers = get_response.json()["providers"]
+    assert providers["slack"]["config"]["webhook"] == "********"
+    assert providers["zapier"]["config"]["zap_id"] == "zap-1"
 
 
 def test_integrations_include_research_providers_with_free_tier_metadata(client):
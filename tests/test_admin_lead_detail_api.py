@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from datetime import datetime
 
+from sqlalchemy import insert
+
 from src.core.db_models import DBInteraction
 from src.core.models import InteractionType
 
@@ -61,13 +63,6 @@ def test_lead_detail_update_notes_opportunities_and_history(client, db_session):
     assert notes_response.status_code == 200, notes_response.text
     assert len(notes_response.json()["items"]) == 1
 
-    list_notes_response = client.get(
-        f"/api/v1/admin/leads/{lead_id}/notes",
-        auth=("admin", "secret"),
-    )
-    assert list_notes_response.status_code == 200
-    assert list_notes_response.json()["items"][0]["content"] == "Premier echange qualifie."
-
     opp_create_response = client.post(
         f"/api/v1/admin/leads/{lead_id}/opportunities",
         auth=("admin", "secret"),
@@ -89,43 +84,65 @@ def test_lead_detail_update_notes_opportunities_and_history(client, db_session):
     assert opp_update_response.status_code == 200, opp_update_response.text
     assert opp_update_response.json()["status"] == "won"
 
-    list_opp_response = client.get(
-        f"/api/v1/admin/leads/{lead_id}/opportunities",
-        auth=("admin", "secret"),
-    )
-    assert list_opp_response.status_code == 200
-    assert len(list_opp_response.json()) == 1
-
-    db_session.add(
-        DBInteraction(
-            lead_id=lead_id,
-            type=InteractionType.EMAIL_SENT,
-            timestamp=datetime.now(),
-            details={"subject": "Intro email"},
-        )
+    db_session.execute(
+        insert(DBInteraction),
+        [
+            {
+                "lead_id": lead_id,
+                "type": InteractionType.EMAIL_SENT,
+                "timestamp": datetime.now(),
+                "details": {"subject": "Intro email"},
+            }
+        ],
     )
     db_session.commit()
 
-    interactions_response = client.get(
-        f"/api/v1/admin/leads/{lead_id}/interactions",
+    bundle_response = client.get(
+        f"/api/v1/admin/leads/{lead_id}/bundle?include=notes,opportunities,interactions,history&window=30d",
         auth=("admin", "secret"),
     )
-    assert interactions_response.status_code == 200
-    assert len(interactions_response.json()) >= 1
-    assert interactions_response.json()[0]["type"] == "EMAIL_SENT"
+    assert bundle_response.status_code == 200, bundle_response.text
+    bundle = bundle_response.json()
 
-    history_response = client.get(
-        f"/api/v1/admin/leads/{lead_id}/history?window=30d",
-        auth=("admin", "secret"),
-    )
-    assert history_response.status_code == 200
-    event_types = {item["event_type"] for item in history_response.json()["items"]}
+    assert bundle["notes"]["items"][0]["content"] == "Premier echange qualifie."
+    assert len(bundle["opportunities"]) == 1
+    assert len(bundle["interactions"]) >= 1
+    assert bundle["interactions"][0]["type"] == "EMAIL_SENT"
+
+    event_types = {item["event_type"] for item in bundle["history"]["items"]}
     assert "lead_updated" in event_types
     assert "lead_notes_updated" in event_types
     assert "lead_opportunity_created" in event_types
     assert "lead_opportunity_updated" in event_types
 
 
+def test_lead_bundle_returns_requested_sections_only(client):
+    lead_id = _create_lead(client)
+
+    notes_only = client.get(
+        f"/api/v1/admin/leads/{lead_id}/bundle?include=notes",
+        auth=("admin", "secret"),
+    )
+    assert notes_only.status_code == 200, notes_only.text
+    assert set(notes_only.json()) == {"lead_id", "notes"}
+
+    work_items = client.get(
+        f"/api/v1/admin/leads/{lead_id}/bundle?include=tasks,projects",
+        auth=("admin", "secret"),
+    )
+    assert work_items.status_code == 200, work_items.text
+    assert work_items.json() == {"lead_id": lead_id, "tasks": [], "projects": []}
+
+    invalid = client.get(
+        f"/api/v1/admin/leads/{lead_id}/bundle?include=notes,unknown",
+        auth=("admin", "secret"),
+    )
+    assert invalid.status_code == 422
+
+    missing = client.get("/api/v1/admin/leads/lead-missing/bundle", auth=("admin", "secret"))
+    assert missing.status_code == 404
+
+
 def test_lead_add_to_campaign_quick_action_endpoint(client):
     lead_id = _create_lead(client, email="lead-campaign-link@example.com")
 
@@ -5,6 +5,8 @@ from datetime import datetime, timedelta
 from src.core.db_models import DBCompany, DBLead
 from src.core.models import LeadStage, LeadStatus
 
+FROZEN_NOW = datetime(2025, 1, 15, 12, 0, 0)
+
 
 def _seed_leads(db_session):
     alpha_company = DBCompany(
@@ -21,10 +23,9 @@ def _seed_leads(db_session):
         location="Miami",
         linkedin_url="",
     )
-    db_session.add_all([alpha_company, beta_company])
-    db_session.flush()
+    db_session.bulk_save_objects([alpha_company, beta_company], return_defaults=True)
 
-    now = datetime.now()
+    now = FROZEN_NOW
     hot_lead = DBLead(
         id="alpha.owner@example.com",
         email="alpha.owner@example.com",
@@ -61,7 +62,7 @@ def _seed_leads(db_session):
         created_at=now - timedelta(days=12),
         last_scored_at=now - timedelta(days=8),
     )
-    db_session.add_all([hot_lead, cold_lead])
+    db_session.bulk_save_objects([hot_lead, cold_lead])
     db_session.commit()
 
 
@@ -89,8 +90,8 @@ def test_leads_support_advanced_score_and_profile_filters(client, db_session):
 
 def test_leads_support_advanced_date_and_boolean_filters(client, db_session):
     _seed_leads(db_session)
-    created_from = (datetime.now() - timedelta(days=3)).isoformat()
-    created_to = datetime.now().isoformat()
+    created_from = (FROZEN_NOW - timedelta(days=3)).isoformat()
+    created_to = FROZEN_NOW.isoformat()
     response = client.get(
         "/api/v1/admin/leads"
         f"?page=1&page_size=25&created_from={created_from}&created_to={created_to}&has_phone=false",
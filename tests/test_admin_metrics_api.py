@@ -6,8 +6,9 @@ from src.core.db_models import DBProject, DBTask
 
 
 def test_metrics_endpoint_reports_request_stats(client):
-    stats_response = client.get("/api/v1/admin/stats", auth=("admin", "secret"))
-    assert stats_response.status_code == 200
+    # A request is recorded once its response is sent, so the first metrics
+    # call is what the second one counts.
+    assert client.get("/api/v1/admin/metrics", auth=("admin", "secret")).status_code == 200
 
     metrics_response = client.get("/api/v1/admin/metrics", auth=("admin", "secret"))
     assert metrics_response.status_code == 200
@@ -20,7 +21,7 @@ def test_metrics_endpoint_reports_request_stats(client):
 
 
 def test_metrics_overview_endpoint_returns_aggregated_sections(client):
-    client.get("/api/v1/admin/stats", auth=("admin", "secret"))
+    client.get("/api/v1/admin/metrics", auth=("admin", "secret"))
 
     response = client.get("/api/v1/admin/metrics/overview", auth=("admin", "secret"))
     assert response.status_code == 200
@@ -52,7 +53,7 @@ def test_sync_health_and_data_integrity_endpoints_detect_orphans(client, db_sess
         updated_at=now - timedelta(days=1),
         created_at=now - timedelta(days=2),
     )
-    db_session.add_all([orphan_task, orphan_project])
+    db_session.bulk_save_objects([orphan_task, orphan_project])
     db_session.commit()
 
     sync_response = client.get("/api/v1/admin/sync/health", auth=("admin", "secret"))
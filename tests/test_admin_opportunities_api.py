@@ -1,5 +1,20 @@
 from __future__ import annotations
 
+import asyncio
+import importlib
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+
+from src.admin.funnel_service import canonical_from_opportunity
+from src.core.db_models import DBAuditLog, DBLead, DBOpportunity
+from src.core.models import LeadStatus
+
+app_module = importlib.import_module("src.admin.app")
+
+pytestmark = pytest.mark.usefixtures("admin_auth")
+
 
 def _create_lead(
     client,
@@ -11,7 +26,6 @@ def _create_lead(
 ) -> str:
     response = client.post(
         "/api/v1/admin/leads",
-        auth=("admin", "secret"),
         json={
             "first_name": first_name,
             "last_name": last_name,
@@ -25,7 +39,7 @@ def _create_lead(
     return response.json()["id"]
 
 
-def _create_opportunity(
+async def _create_opportunity(
     client,
     *,
     prospect_id: str,
@@ -35,9 +49,8 @@ def _create_opportunity(
     close_date: str,
     assigned_to: str = "Vous",
 ) -> dict:
-    response = client.post(
+    response = await client.post(
         "/api/v1/admin/opportunities",
-        auth=("admin", "secret"),
         json={
             "prospect_id": prospect_id,
             "amount": amount,
@@ -51,12 +64,100 @@ def _create_opportunity(
     return response.json()
 
 
-def test_opportunities_crud_filters_and_summary(client):
-    lead_1 = _create_lead(client, email="opp-a@example.com", first_name="Alice", last_name="Martin")
-    lead_2 = _create_lead(client, email="opp-b@example.com", first_name="Bob", last_name="Durand")
+def _seed_pipeline(db_session, *, leads: list[dict], opportunities: list[dict]) -> None:
+    db_session.bulk_insert_mappings(DBLead, leads)
+    db_session.bulk_insert_mappings(DBOpportunity, opportunities)
+    db_session.commit()
+
 
-    opp_1 = _create_opportunity(
-        client,
+def _opportunity_row(
+    opportunity_id: str,
+    *,
+    lead_id: str,
+    amount: float,
+    stage: str,
+    probability: int,
+    close_date: str,
+    assigned_to: str,
+    owner_user_id: str | None = None,
+) -> dict:
+    # Mirror _create_opportunity_payload: derived columns come from the same
+    # helpers the create route uses rather than being recomputed here.
+    stage_value = app_module._coerce_pipeline_opportunity_stage(stage)
+    return {
+        "id": opportunity_id,
+        "lead_id": lead_id,
+        "name": f"Opportunite - {opportunity_id}",
+        "stage": stage_value,
+        "status": app_module._infer_opportunity_status_from_stage(stage_value),
+        "owner_user_id": owner_user_id,
+        "stage_canonical": canonical_from_opportunity(DBOpportunity(stage=stage_value)),
+        "stage_entered_at": datetime.utcnow(),
+        "amount": amount,
+        "probability": probability,
+        "assigned_to": app_module._coerce_assigned_to(assigned_to),
+        "expected_close_date": datetime.fromisoformat(close_date),
+        "details_json": {},
+    }
+
+
+@pytest.mark.anyio
+async def test_opportunities_crud_filters_and_summary(fresh_async_client, fresh_db_session):
+    lead_1 = "opp-a@example.com"
+    lead_2 = "opp-b@example.com"
+    _seed_pipeline(
+        fresh_db_session,
+        leads=[
+            {
+                "id": lead_1,
+                "first_name": "Alice",
+                "last_name": "Martin",
+                "email": lead_1,
+                "status": LeadStatus.NEW,
+                "segment": "SMB",
+            },
+            {
+                "id": lead_2,
+                "first_name": "Bob",
+                "last_name": "Durand",
+                "email": lead_2,
+                "status": LeadStatus.NEW,
+                "segment": "SMB",
+            }
+        ],
+        opportunities=[
+            _opportunity_row(
+                "opp-2",
+                lead_id=lead_2,
+                amount=2000,
+                stage="Won",
+                probability=100,
+                close_date="2026-03-20T12:00:00",
+                assigned_to="Nicolas AE",
+            ),
+            _opportunity_row(
+                "opp-3",
+                lead_id=lead_1,
+                amount=1500,
+                stage="Lost",
+                probability=0,
+                close_date="2026-03-22T12:00:00",
+                assigned_to="Nicolas AE",
+            ),
+            _opportunity_row(
+                "opp-4",
+                lead_id=lead_2,
+                amount=500,
+                stage="Qualified",
+                probability=30,
+                close_date="2026-03-25T12:00:00",
+                assigned_to="Alice SDR",
+            ),
+        ],
+    )
+    # One opportunity still goes through the API so the create route stays covered.
+    opp_1 = await _create_opportunity(
+        fresh_async_client,
         prospect_id=lead_1,
         amount=1000,
         stage="Prospect",
@@ -64,77 +165,40 @@ def test_opportunities_crud_filters_and_summary(client):
         close_date="2026-03-10T12:00:00",
         assigned_to="Alice SDR",
     )
-    opp_2 = _create_opportunity(
-        client,
-        prospect_id=lead_2,
-        amount=2000,
-        stage="Won",
-        probability=100,
-        close_date="2026-03-20T12:00:00",
-        assigned_to="Nicolas AE",
-    )
-    opp_3 = _create_opportunity(
-        client,
-        prospect_id=lead_1,
-        amount=1500,
-        stage="Lost",
-        probability=0,
-        close_date="2026-03-22T12:00:00",
-        assigned_to="Nicolas AE",
-    )
-    _create_opportunity(
-        client,
-        prospect_id=lead_2,
-        amount=500,
-        stage="Qualified",
-        probability=30,
-        close_date="2026-03-25T12:00:00",
-        assigned_to="Alice SDR",
-    )
 
-    list_response = client.get(
-        "/api/v1/admin/opportunities?page=1&page_size=25&sort=created_at&order=desc",
-        auth=("admin", "secret"),
+    # The full listing and one combined server-side filter (status, amount
+    # and date parsing) only read, so both requests are in flight at once.
+    list_response, filtered = await asyncio.gather(
+        fresh_async_client.get(
+            "/api/v1/admin/opportunities?page=1&page_size=25&sort=created_at&order=desc",
+        ),
+        fresh_async_client.get(
+            "/api/v1/admin/opportunities?status=Won&amount_min=1400&amount_max=2100"
+            "&date_field=close&date_from=2026-03-19&date_to=2026-03-21&page=1&page_size=25",
+        ),
     )
     assert list_response.status_code == 200, list_response.text
     payload = list_response.json()
     assert payload["page"] == 1
     assert payload["page_size"] == 25
-    assert payload["total"] >= 4
-    assert len(payload["items"]) >= 4
+    assert payload["total"] == 4
+    assert len(payload["items"]) == 4
     assert all("prospect_name" in item for item in payload["items"])
     assert all("assigned_to" in item for item in payload["items"])
 
-    status_filtered = client.get(
-        "/api/v1/admin/opportunities?status=Won&page=1&page_size=25",
-        auth=("admin", "secret"),
-    )
-    assert status_filtered.status_code == 200
-    won_items = status_filtered.json()["items"]
+    items = payload["items"]
+    won_items = [item for item in items if item["stage"] == "Won"]
     assert len(won_items) == 1
-    assert won_items[0]["stage"] == "Won"
-
-    amount_filtered = client.get(
-        "/api/v1/admin/opportunities?amount_min=1400&amount_max=2100&page=1&page_size=25",
-        auth=("admin", "secret"),
-    )
-    assert amount_filtered.status_code == 200
-    amount_items = amount_filtered.json()["items"]
+    amount_items = [item for item in items if 1400 <= float(item["amount"]) <= 2100]
     assert len(amount_items) == 2
-    assert all(1400 <= float(item["amount"]) <= 2100 for item in amount_items)
 
-    date_filtered = client.get(
-        "/api/v1/admin/opportunities?date_field=close&date_from=2026-03-19&date_to=2026-03-21&page=1&page_size=25",
-        auth=("admin", "secret"),
-    )
-    assert date_filtered.status_code == 200
-    date_items = date_filtered.json()["items"]
-    assert len(date_items) == 1
-    assert date_items[0]["id"] == opp_2["id"]
+    assert filtered.status_code == 200
+    filtered_items = filtered.json()["items"]
+    assert [item["id"] for item in filtered_items] == ["opp-2"]
+    assert filtered_items[0]["stage"] == "Won"
 
-    patch_response = client.patch(
+    patch_response = await fresh_async_client.patch(
         f"/api/v1/admin/opportunities/{opp_1['id']}",
-        auth=("admin", "secret"),
         json={"stage": "Qualified", "probability": 40, "amount": 1200, "close_date": "2026-03-12T10:30:00"},
     )
     assert patch_response.status_code == 200, patch_response.text
@@ -143,89 +207,75 @@ def test_opportunities_crud_filters_and_summary(client):
     assert patched["probability"] == 40
     assert float(patched["amount"]) == 1200
 
-    summary_response = client.get(
-        "/api/v1/admin/opportunities/summary",
-        auth=("admin", "secret"),
-    )
-    assert summary_response.status_code == 200, summary_response.text
-    summary = summary_response.json()
+    # The aggregate math is checked on the summary builder directly; the
+    # route is covered below with a filter, which also checks param wiring.
+    summary = app_module._build_opportunities_summary_payload(fresh_db_session)
     # Total amount after patch: 1200 + 2000 + 1500 + 500 = 5200
-    assert float(summary["pipeline_value_total"]) == 5200
+    assert summary["pipeline_value_total"] == 5200
     # Won=1, Lost=1 => win rate = 50%
-    assert float(summary["win_rate_percent"]) == 50.0
+    assert summary["win_rate_percent"] == 50.0
     # Closed=(Won+Lost)=2 over total=4 => close rate = 50%
-    assert float(summary["close_rate_percent"]) == 50.0
+    assert summary["close_rate_percent"] == 50.0
     # Avg = 5200 / 4
-    assert float(summary["avg_deal_size"]) == 1300.0
+    assert summary["avg_deal_size"] == 1300.0
     assert len(summary["forecast_monthly"]) >= 1
     march_bucket = next((row for row in summary["forecast_monthly"] if row["month"] == "2026-03"), None)
     assert march_bucket is not None
-    assert float(march_bucket["expected_revenue"]) == 5200.0
-    assert float(march_bucket["weighted_revenue"]) == 2630.0
+    assert march_bucket["expected_revenue"] == 5200.0
+    assert march_bucket["weighted_revenue"] == 2630.0
 
-    delete_response = client.delete(
-        f"/api/v1/admin/opportunities/{opp_3['id']}",
-        auth=("admin", "secret"),
-    )
+    won_summary_response = await fresh_async_client.get("/api/v1/admin/opportunities/summary?status=Won")
+    assert won_summary_response.status_code == 200, won_summary_response.text
+    won_summary = won_summary_response.json()
+    assert float(won_summary["pipeline_value_total"]) == 2000
+    assert float(won_summary["win_rate_percent"]) == 100.0
+    assert won_summary["total_count"] == 1
+
+    delete_response = await fresh_async_client.delete("/api/v1/admin/opportunities/opp-3")
     assert delete_response.status_code == 200
     assert delete_response.json()["deleted"] is True
 
 
-def test_opportunity_validation_errors(client):
-    lead_id = _create_lead(client, email="opp-validation@example.com")
-
-    invalid_stage = client.post(
-        "/api/v1/admin/opportunities",
-        auth=("admin", "secret"),
-        json={
-            "prospect_id": lead_id,
-            "amount": 1000,
-            "stage": "invalid-stage",
-            "probability": 50,
-            "close_date": "2026-04-01T12:00:00",
-        },
-    )
-    assert invalid_stage.status_code == 422
-
-    invalid_list = client.get(
-        "/api/v1/admin/opportunities?date_field=invalid",
-        auth=("admin", "secret"),
-    )
-    assert invalid_list.status_code == 422
-
-    invalid_range = client.get(
-        "/api/v1/admin/opportunities?amount_min=3000&amount_max=1000",
-        auth=("admin", "secret"),
-    )
-    assert invalid_range.status_code == 422
+@pytest.mark.parametrize(
+    ("method", "path", "body"),
+    [
+        pytest.param(
+            "POST",
+            "/api/v1/admin/opportunities",
+            {"amount": 1000, "stage": "invalid-stage", "probability": 50, "close_date": "2026-04-01T12:00:00"},
+            id="invalid-stage",
+        ),
+        pytest.param("GET", "/api/v1/admin/opportunities?date_field=invalid", None, id="invalid-date-field"),
+        pytest.param(
+            "GET",
+            "/api/v1/admin/opportunities?amount_min=3000&amount_max=1000",
+            None,
+            id="inverted-amount-range",
+        ),
+    ],
+)
+def test_opportunity_validation_errors(client, method, path, body):
+    if body is not None:
+        # Stage is validated after the prospect lookup, so the lead must exist.
+        body = {**body, "prospect_id": _create_lead(client, email="opp-validation@example.com")}
+    response = client.request(method, path, json=body)
+    assert response.status_code == 422
 
 
 def test_opportunity_quick_lead_endpoint(client):
-    first_create = client.post(
-        "/api/v1/admin/opportunities/quick-lead",
-        auth=("admin", "secret"),
-        json={
-            "first_name": "Nora",
-            "last_name": "Lopez",
-            "email": "opp-quick@example.com",
-            "company_name": "Quick Dental",
-        },
-    )
+    quick_lead = {
+        "first_name": "Nora",
+        "last_name": "Lopez",
+        "email": "opp-quick@example.com",
+        "company_name": "Quick Dental",
+    }
+    first_create = client.post("/api/v1/admin/opportunities/quick-lead", json=quick_lead)
     assert first_create.status_code == 200, first_create.text
     first_payload = first_create.json()
     assert first_payload["created"] is True
     assert first_payload["lead"]["id"]
 
-    second_create = client.post(
-        "/api/v1/admin/opportunities/quick-lead",
-        auth=("admin", "secret"),
-        json={
-            "first_name": "Nora",
-            "last_name": "Lopez",
-            "email": "opp-quick@example.com",
-            "company_name": "Quick Dental",
-        },
-    )
+    second_create = client.post("/api/v1/admin/opportunities/quick-lead", json=quick_lead)
     assert second_create.status_code == 200, second_create.text
     second_payload = second_create.json()
     assert second_payload["created"] is False
@@ -233,7 +283,6 @@ def test_opportunity_quick_lead_endpoint(client):
 
     opp_create = client.post(
         "/api/v1/admin/opportunities",
-        auth=("admin", "secret"),
         json={
             "prospect_id": first_payload["lead"]["id"],
             "amount": 2500,
@@ -244,3 +293,46 @@ def test_opportunity_quick_lead_endpoint(client):
     )
     assert opp_create.status_code == 200, opp_create.text
     assert opp_create.json()["prospect_id"] == first_payload["lead"]["id"]
+
+
+def test_opportunity_quick_lead_bulk_reports_failed_items(client, db_session, monkeypatch):
+    create_lead_payload = app_module._create_lead_payload
+
+    def conflicting_create_lead_payload(db, payload):
+        # The batch's second item loses a race with a concurrent create.
+        if str(payload.email) == "opp-race@example.com":
+            raise HTTPException(status_code=409, detail="Lead already exists for email opp-race@example.com.")
+        return create_lead_payload(db, payload)
+
+    monkeypatch.setattr(app_module, "_create_lead_payload", conflicting_create_lead_payload)
+    items = [
+        {"first_name": "Ana", "last_name": "Roy", "email": f"opp-{name}@example.com", "company_name": "Quick Dental"}
+        for name in ("first", "race", "last", "first")
+    ]
+    response = client.post("/api/v1/admin/opportunities/quick-lead/bulk", json={"items": items})
+    assert response.status_code == 200, response.text
+    payload = response.json()
+    assert payload["created_count"] == 2
+    assert payload["failed_count"] == 1
+    first, failed, last, repeated = payload["items"]
+    assert first["created"] is True and last["created"] is True
+    assert first["error"] is None
+    # A repeated email resolves to the lead created earlier in the batch.
+    assert repeated["created"] is False
+    assert repeated["lead"]["id"] == first["lead"]["id"]
+    assert failed == {
+        "created": False,
+        "lead": None,
+        "error": "Lead already exists for email opp-race@example.com.",
+    }
+    assert db_session.get(DBLead, "opp-first@example.com") is not None
+    assert db_session.get(DBLead, "opp-last@example.com") is not None
+
+    audit_entry = db_session.query(DBAuditLog).filter(DBAuditLog.action == "opportunity_quick_lead_bulk").one()
+    assert audit_entry.metadata_json["created"] == 2
+    assert audit_entry.metadata_json["failed"] == 1
+    assert audit_entry.metadata_json["lead_ids"] == [
+        "opp-first@example.com",
+        "opp-last@example.com",
+        "opp-first@example.com",
+    ]
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import pytest
 
-def test_project_detail_workspace_and_activity(client):
-    create_project_response = client.post(
+pytestmark = pytest.mark.usefixtures("admin_auth")
+
+
+def test_project_detail_workspace_and_activity(fresh_client):
+    create_project_response = fresh_client.post(
         "/api/v1/admin/projects",
-        auth=("admin", "secret"),
         json={
             "name": "Projet Detail Test",
             "description": "Validation page detail projet",
@@ -40,10 +43,7 @@ def test_project_detail_workspace_and_activity(client):
     project = create_project_response.json()
     project_id = project["id"]
 
-    get_project_response = client.get(
-        f"/api/v1/admin/projects/{project_id}",
-        auth=("admin", "secret"),
-    )
+    get_project_response = fresh_client.get(f"/api/v1/admin/projects/{project_id}")
     assert get_project_response.status_code == 200, get_project_response.text
     detail = get_project_response.json()
     assert detail["id"] == project_id
@@ -52,9 +52,8 @@ def test_project_detail_workspace_and_activity(client):
     assert len(detail["timeline"]) == 1
     assert len(detail["deliverables"]) == 1
 
-    create_task_response = client.post(
+    create_task_response = fresh_client.post(
         "/api/v1/admin/tasks",
-        auth=("admin", "secret"),
         json={
             "title": "Task liee projet",
             "status": "To Do",
@@ -67,18 +66,14 @@ def test_project_detail_workspace_and_activity(client):
     task = create_task_response.json()
     assert task["project_id"] == project_id
 
-    list_tasks_response = client.get(
-        f"/api/v1/admin/tasks?page=1&page_size=20&project_id={project_id}",
-        auth=("admin", "secret"),
-    )
+    list_tasks_response = fresh_client.get(f"/api/v1/admin/tasks?page=1&page_size=20&project_id={project_id}")
     assert list_tasks_response.status_code == 200, list_tasks_response.text
     tasks_payload = list_tasks_response.json()
-    assert tasks_payload["total"] >= 1
+    assert tasks_payload["total"] == 1
     assert any(item["id"] == task["id"] for item in tasks_payload["items"])
 
-    patch_project_response = client.patch(
+    patch_project_response = fresh_client.patch(
         f"/api/v1/admin/projects/{project_id}",
-        auth=("admin", "secret"),
         json={
             "status": "In Progress",
             "progress_percent": 45,
@@ -96,10 +91,7 @@ def test_project_detail_workspace_and_activity(client):
     assert patched["budget_spent"] == 4100
     assert len(patched["team"]) == 2
 
-    project_activity_response = client.get(
-        f"/api/v1/admin/projects/{project_id}/activity?limit=30",
-        auth=("admin", "secret"),
-    )
+    project_activity_response = fresh_client.get(f"/api/v1/admin/projects/{project_id}/activity?limit=30")
     assert project_activity_response.status_code == 200, project_activity_response.text
     activity_payload = project_activity_response.json()
     assert activity_payload["project_id"] == project_id
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import pytest
+
+pytestmark = pytest.mark.usefixtures("admin_auth")
+
 
 def test_projects_crud_flow(client):
     create_payload = {
@@ -10,7 +14,6 @@ def test_projects_crud_flow(client):
     }
     create_response = client.post(
         "/api/v1/admin/projects",
-        auth=("admin", "secret"),
         json=create_payload,
     )
     assert create_response.status_code == 200
@@ -19,7 +22,7 @@ def test_projects_crud_flow(client):
     assert created["status"] == "Planning"
     assert created["id"]
 
-    list_response = client.get("/api/v1/admin/projects", auth=("admin", "secret"))
+    list_response = client.get("/api/v1/admin/projects")
     assert list_response.status_code == 200
     data = list_response.json()
     assert "items" in data
@@ -29,16 +32,12 @@ def test_projects_crud_flow(client):
 
     update_response = client.patch(
         f"/api/v1/admin/projects/{created['id']}",
-        auth=("admin", "secret"),
         json={"status": "Completed"},
     )
     assert update_response.status_code == 200
     assert update_response.json()["status"] == "Completed"
 
-    delete_response = client.delete(
-        f"/api/v1/admin/projects/{created['id']}",
-        auth=("admin", "secret"),
-    )
+    delete_response = client.delete(f"/api/v1/admin/projects/{created['id']}")
     assert delete_response.status_code == 200
     assert delete_response.json()["deleted"] is True
 
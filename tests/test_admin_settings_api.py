@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import pytest
+
+pytestmark = pytest.mark.usefixtures("admin_auth")
+
 
 def test_settings_defaults_and_persistence(client):
-    default_response = client.get("/api/v1/admin/settings", auth=("admin", "secret"))
+    default_response = client.get("/api/v1/admin/settings")
     assert default_response.status_code == 200
     defaults = default_response.json()
     assert "organization_name" in defaults
@@ -25,7 +29,6 @@ def test_settings_defaults_and_persistence(client):
     }
     update_response = client.put(
         "/api/v1/admin/settings",
-        auth=("admin", "secret"),
         json=update_payload,
     )
     assert update_response.status_code == 200
@@ -36,7 +39,7 @@ def test_settings_defaults_and_persistence(client):
     assert updated["default_refresh_mode"] == "manual"
     assert updated["notifications"]["email"] is False
 
-    read_back_response = client.get("/api/v1/admin/settings", auth=("admin", "secret"))
+    read_back_response = client.get("/api/v1/admin/settings")
     assert read_back_response.status_code == 200
     read_back = read_back_response.json()
     assert read_back["organization_name"] == "Prospect France"
@@ -54,7 +57,6 @@ def test_settings_validation(client):
     }
     response = client.put(
         "/api/v1/admin/settings",
-        auth=("admin", "secret"),
         json=invalid_payload,
     )
     assert response.status_code == 422
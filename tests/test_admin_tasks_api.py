@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import pytest
+
+pytestmark = pytest.mark.usefixtures("admin_auth")
+
 
 def test_tasks_crud_flow(client):
     create_payload = {
@@ -10,7 +14,6 @@ def test_tasks_crud_flow(client):
     }
     create_response = client.post(
         "/api/v1/admin/tasks",
-        auth=("admin", "secret"),
         json=create_payload,
     )
     assert create_response.status_code == 200
@@ -20,7 +23,6 @@ def test_tasks_crud_flow(client):
 
     update_response = client.patch(
         f"/api/v1/admin/tasks/{created['id']}",
-        auth=("admin", "secret"),
         json={"status": "Done", "priority": "High"},
     )
     assert update_response.status_code == 200
@@ -28,43 +30,36 @@ def test_tasks_crud_flow(client):
     assert updated["status"] == "Done"
     assert updated["priority"] == "High"
 
-    delete_response = client.delete(
-        f"/api/v1/admin/tasks/{created['id']}",
-        auth=("admin", "secret"),
-    )
+    delete_response = client.delete(f"/api/v1/admin/tasks/{created['id']}")
     assert delete_response.status_code == 200
     assert delete_response.json()["deleted"] is True
 
 
-def test_tasks_list_supports_filters_pagination_and_sort(client):
+def test_tasks_list_supports_filters_pagination_and_sort(fresh_client):
     payloads = [
         {"title": "Appel prospect alpha", "status": "To Do", "priority": "Low", "assigned_to": "Alice"},
         {"title": "Relance prospect beta", "status": "Done", "priority": "High", "assigned_to": "Bob"},
         {"title": "Email prospect gamma", "status": "In Progress", "priority": "Medium", "assigned_to": "Alice"},
     ]
     for payload in payloads:
-        response = client.post("/api/v1/admin/tasks", auth=("admin", "secret"), json=payload)
+        response = fresh_client.post("/api/v1/admin/tasks", json=payload)
         assert response.status_code == 200
 
-    filtered = client.get(
+    filtered = fresh_client.get(
         "/api/v1/admin/tasks?page=1&page_size=10&q=prospect&status=To%20Do&sort=title&order=asc",
-        auth=("admin", "secret"),
     )
     assert filtered.status_code == 200
     data = filtered.json()
     assert data["page"] == 1
     assert data["page_size"] == 10
-    assert data["total"] >= 1
-    assert len(data["items"]) >= 1
+    assert data["total"] == 1
+    assert len(data["items"]) == 1
     assert all(item["status"] == "To Do" for item in data["items"])
 
-    paged = client.get(
-        "/api/v1/admin/tasks?page=1&page_size=2&sort=created_at&order=desc",
-        auth=("admin", "secret"),
-    )
+    paged = fresh_client.get("/api/v1/admin/tasks?page=1&page_size=2&sort=created_at&order=desc")
     assert paged.status_code == 200
     payload = paged.json()
     assert payload["page"] == 1
     assert payload["page_size"] == 2
-    assert payload["total"] >= 3
-    assert len(payload["items"]) <= 2
+    assert payload["total"] == 3
+    assert len(payload["items"]) == 2
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import pytest
 
-def test_roles_seeded(client):
-    response = client.get("/api/v1/admin/roles", auth=("admin", "secret"))
-    assert response.status_code == 200
-    payload = response.json()
-    keys = {item["key"] for item in payload["items"]}
+pytestmark = pytest.mark.usefixtures("admin_auth")
+
+
+@pytest.fixture(scope="session")
+def roles_payload(static_get):
+    return static_get("/api/v1/admin/roles")
+
+
+def test_roles_seeded(roles_payload):
+    keys = {item["key"] for item in roles_payload["items"]}
     assert {"admin", "manager", "sales"}.issubset(keys)
 
 
@@ -17,7 +23,6 @@ def test_invite_and_update_user_flow(client):
     }
     invite_response = client.post(
         "/api/v1/admin/users/invite",
-        auth=("admin", "secret"),
         json=invite_payload,
     )
     assert invite_response.status_code == 200
@@ -28,7 +33,6 @@ def test_invite_and_update_user_flow(client):
 
     update_response = client.patch(
         f"/api/v1/admin/users/{invited['id']}",
-        auth=("admin", "secret"),
         json={"status": "active", "roles": ["admin", "sales"]},
     )
     assert update_response.status_code == 200
@@ -36,7 +40,7 @@ def test_invite_and_update_user_flow(client):
     assert updated["status"] == "active"
     assert set(updated["roles"]) == {"admin", "sales"}
 
-    users_response = client.get("/api/v1/admin/users", auth=("admin", "secret"))
+    users_response = client.get("/api/v1/admin/users")
     assert users_response.status_code == 200
     users = users_response.json()["items"]
     assert any(item["email"] == "manager@example.com" for item in users)
@@ -1,67 +1,84 @@
 from __future__ import annotations
 
 import importlib
+from unittest.mock import MagicMock
 
+import pytest
 
-def test_web_research_endpoint_returns_normalized_payload(client, monkeypatch):
-    def fake_run_web_research(**kwargs):
-        assert kwargs["query"] == "best free lead tools"
-        assert kwargs["provider_selector"] == "duckduckgo"
-        assert kwargs["limit"] == 5
-        return {
-            "query": kwargs["query"],
-            "provider_selector": kwargs["provider_selector"],
-            "providers_requested": ["duckduckgo"],
-            "providers_used": ["duckduckgo"],
-            "total": 1,
-            "items": [
-                {
-                    "provider": "duckduckgo",
-                    "source": "duckduckgo",
-                    "title": "Free lead generation tools",
-                    "url": "https://example.com/free-tools",
-                    "snippet": "Collection of free tools",
-                    "published_at": None,
-                }
-            ],
-            "warnings": [],
-        }
+# ``src.admin`` re-exports the FastAPI instance as ``app``, so resolve the
+# module itself once through importlib.
+app_module = importlib.import_module("src.admin.app")
 
-    app_module = importlib.import_module("src.admin.app")
-    monkeypatch.setattr(app_module, "run_web_research", fake_run_web_research)
+pytestmark = pytest.mark.usefixtures("admin_auth")
+
+_FAKE_RESULTS = {
+    "best free lead tools": {
+        "providers_used": ["duckduckgo"],
+        "items": [
+            {
+                "provider": "duckduckgo",
+                "source": "duckduckgo",
+                "title": "Free lead generation tools",
+                "url": "https://example.com/free-tools",
+                "snippet": "Collection of free tools",
+                "published_at": None,
+            }
+        ],
+        "warnings": [],
+    },
+    "firecrawl": {
+        "providers_used": [],
+        "items": [],
+        "warnings": ["no results"],
+    },
+}
+
+
+def _fake_run_web_research(**kwargs):
+    result = _FAKE_RESULTS[kwargs["query"]]
+    return {
+        "query": kwargs["query"],
+        "provider_selector": kwargs["provider_selector"],
+        "providers_requested": ["duckduckgo"],
+        "providers_used": result["providers_used"],
+        "total": len(result["items"]),
+        "items": result["items"],
+        "warnings": result["warnings"],
+    }
+
+
+@pytest.fixture(scope="module", autouse=True)
+def patched_web_research():
+    research_mock = MagicMock(side_effect=_fake_run_web_research)
+    with pytest.MonkeyPatch.context() as module_monkeypatch:
+        module_monkeypatch.setattr(app_module, "run_web_research", research_mock)
+        yield research_mock
+
+
+@pytest.fixture
+def web_research(patched_web_research):
+    patched_web_research.reset_mock()
+    return patched_web_research
+
+
+def test_web_research_endpoint_returns_normalized_payload(client, web_research):
     response = client.get(
         "/api/v1/admin/research/web?q=best%20free%20lead%20tools&provider=duckduckgo&limit=5",
-        auth=("admin", "secret"),
     )
     assert response.status_code == 200
+    kwargs = web_research.call_args.kwargs
+    assert kwargs["query"] == "best free lead tools"
+    assert kwargs["provider_selector"] == "duckduckgo"
+    assert kwargs["limit"] == 5
     payload = response.json()
     assert payload["total"] == 1
     assert payload["items"][0]["provider"] == "duckduckgo"
 
 
-def test_web_research_endpoint_passes_integration_provider_config(client, monkeypatch):
-    captured = {}
-
-    def fake_run_web_research(**kwargs):
-        captured["providers"] = kwargs["provider_configs"]
-        return {
-            "query": kwargs["query"],
-            "provider_selector": kwargs["provider_selector"],
-            "providers_requested": ["duckduckgo"],
-            "providers_used": [],
-            "total": 0,
-            "items": [],
-            "warnings": ["no results"],
-        }
-
-    app_module = importlib.import_module("src.admin.app")
-    monkeypatch.setattr(app_module, "run_web_research", fake_run_web_research)
-    response = client.get(
-        "/api/v1/admin/research/web?q=firecrawl&provider=auto&limit=3",
-        auth=("admin", "secret"),
-    )
+def test_web_research_endpoint_passes_integration_provider_config(client, web_research):
+    response = client.get("/api/v1/admin/research/web?q=firecrawl&provider=auto&limit=3")
     assert response.status_code == 200
-    providers = captured["providers"]
+    providers = web_research.call_args.kwargs["provider_configs"]
     assert "duckduckgo" in providers
     assert "perplexity" in providers
     assert "firecrawl" in providers
@@ -1,55 +1,70 @@
 from __future__ import annotations
 
-import importlib.util
-import json
+import hashlib
+import os
+import time
 from pathlib import Path
+from unittest import mock
 
-def _load_ingest_module():
-    module_path = Path(__file__).resolve().parents[1] / "scripts" / "utilities" / "ingest_compagnie_docs.py"
-    spec = importlib.util.spec_from_file_location("ingest_compagnie_docs", module_path)
-    assert spec is not None
-    assert spec.loader is not None
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
+import orjson
+import pytest
 
 
-def _write_minimal_pdf_bytes(path: Path) -> None:
-    path.write_bytes(b"%PDF-1.4\n1 0 obj\n<<>>\nendobj\ntrailer\n<<>>\n%%EOF")
+_MIN_PDF_BYTES = b"%PDF-1.4\n1 0 obj\n<<>>\nendobj\ntrailer\n<<>>\n%%EOF"
 
 
-def _read_index_json(target_dir: Path) -> dict:
-    index_path = target_dir / "index" / "corpus_index.json"
-    return json.loads(index_path.read_text(encoding="utf-8"))
+def _fake_pdf_ok(*_args, **_kwargs) -> dict:
+    # A fresh result per call, so nothing the ingester mutates leaks between documents.
+    return {
+        "ok": True,
+        "error": None,
+        "page_count": 1,
+        "pages": [{"page": 1, "text": "sample extracted text", "char_count": 21}],
+        "full_text": "sample extracted text",
+        "extraction_warnings": [],
+    }
 
 
-def test_ingest_creates_outputs_for_pdf_and_fig(tmp_path):
-    ingest_module = _load_ingest_module()
-    source_dir = tmp_path / "CompagnieDocs"
-    target_dir = tmp_path / "assets" / "reference" / "compagnie_docs"
+def _fake_pdf_empty(*_args, **_kwargs) -> dict:
+    return {
+        "ok": True,
+        "error": None,
+        "page_count": 1,
+        "pages": [{"page": 1, "text": "", "char_count": 0}],
+        "full_text": "",
+        "extraction_warnings": ["page_1_empty"],
+    }
+
+
+@pytest.fixture(autouse=True)
+def _stat_cache_dir(tmp_path, monkeypatch, ingest_module):
+    # Keep runs that rely on the default stat cache out of the repo checkout.
+    monkeypatch.setattr(ingest_module, "STAT_CACHE_DIR", tmp_path / "stat-cache")
+
+
+def _write_sources(source_dir: Path, files: dict[str, bytes]) -> None:
     source_dir.mkdir(parents=True, exist_ok=True)
+    for name, content in files.items():
+        (source_dir / name).write_bytes(content)
 
-    _write_minimal_pdf_bytes(source_dir / "Doc A.pdf")
-    (source_dir / "Pitch.fig").write_bytes(b"fig-content-1")
 
-    def _fake_pdf_extraction(_: Path) -> dict:
-        return {
-            "ok": True,
-            "error": None,
-            "page_count": 1,
-            "pages": [{"page": 1, "text": "sample extracted text", "char_count": 21}],
-            "full_text": "sample extracted text",
-            "extraction_warnings": [],
-        }
+def _read_index_json(target_dir: Path) -> dict:
+    index_path = target_dir / "index" / "corpus_index.json"
+    return orjson.loads(index_path.read_bytes())
 
-    ingest_module._extract_pdf_content = _fake_pdf_extraction
 
-    result = ingest_module.ingest_compagnie_docs(
-        source_dir=source_dir,
-        target_dir=target_dir,
-        mode="full",
-        enable_figma_export=False,
-    )
+def test_ingest_creates_outputs_for_pdf_and_fig(tmp_path, ingest_module):
+    source_dir = tmp_path / "CompagnieDocs"
+    target_dir = tmp_path / "assets" / "reference" / "compagnie_docs"
+    _write_sources(source_dir, {"Doc A.pdf": _MIN_PDF_BYTES, "Pitch.fig": b"fig-content-1"})
+
+    with mock.patch.object(ingest_module, "_extract_pdf_content", autospec=True, side_effect=_fake_pdf_ok):
+        result = ingest_module.ingest_compagnie_docs(
+            source_dir=source_dir,
+            target_dir=target_dir,
+            mode="full",
+            enable_figma_export=False,
+        )
 
     assert result["stats"]["total_files"] == 2
     assert result["stats"]["processed_pdf"] == 1
@@ -69,7 +84,7 @@ def test_ingest_creates_outputs_for_pdf_and_fig(tmp_path):
     pdf_md_path = Path(pdf_doc["processing"]["pdf"]["markdown_path"])
     assert pdf_json_path.exists()
     assert pdf_md_path.exists()
-    pdf_payload = json.loads(pdf_json_path.read_text(encoding="utf-8"))
+    pdf_payload = orjson.loads(pdf_json_path.read_bytes())
     assert pdf_payload["page_count"] == 1
     assert pdf_payload["full_text"] == "sample extracted text"
 
@@ -77,46 +92,37 @@ def test_ingest_creates_outputs_for_pdf_and_fig(tmp_path):
     assert fig_doc["status"] == "pending_conversion"
     fig_manifest_path = Path(fig_doc["processing"]["fig"]["manifest_path"])
     assert fig_manifest_path.exists()
-    fig_manifest = json.loads(fig_manifest_path.read_text(encoding="utf-8"))
+    fig_manifest = orjson.loads(fig_manifest_path.read_bytes())
     assert fig_manifest["conversion_status"] == "pending_conversion"
 
 
-def test_ingest_is_idempotent_and_deduplicates_by_hash(tmp_path):
-    ingest_module = _load_ingest_module()
+def test_ingest_is_idempotent_and_deduplicates_by_hash(tmp_path, ingest_module):
     source_dir = tmp_path / "CompagnieDocs"
     target_dir = tmp_path / "assets" / "reference" / "compagnie_docs"
-    source_dir.mkdir(parents=True, exist_ok=True)
-
-    _write_minimal_pdf_bytes(source_dir / "Manual.pdf")
     duplicate_payload = b"same-fig-binary"
-    (source_dir / "Design A.fig").write_bytes(duplicate_payload)
-    (source_dir / "Design B.fig").write_bytes(duplicate_payload)
-
-    def _fake_pdf_extraction(_: Path) -> dict:
-        return {
-            "ok": True,
-            "error": None,
-            "page_count": 1,
-            "pages": [{"page": 1, "text": "", "char_count": 0}],
-            "full_text": "",
-            "extraction_warnings": ["page_1_empty"],
-        }
-
-    ingest_module._extract_pdf_content = _fake_pdf_extraction
-
-    first = ingest_module.ingest_compagnie_docs(
-        source_dir=source_dir,
-        target_dir=target_dir,
-        mode="full",
-        enable_figma_export=False,
-    )
-    second = ingest_module.ingest_compagnie_docs(
-        source_dir=source_dir,
-        target_dir=target_dir,
-        mode="full",
-        enable_figma_export=False,
+    _write_sources(
+        source_dir,
+        {
+            "Manual.pdf": _MIN_PDF_BYTES,
+            "Design A.fig": duplicate_payload,
+            "Design B.fig": duplicate_payload,
+        },
     )
 
+    with mock.patch.object(ingest_module, "_extract_pdf_content", autospec=True, side_effect=_fake_pdf_empty):
+        first = ingest_module.ingest_compagnie_docs(
+            source_dir=source_dir,
+            target_dir=target_dir,
+            mode="full",
+            enable_figma_export=False,
+        )
+        second = ingest_module.ingest_compagnie_docs(
+            source_dir=source_dir,
+            target_dir=target_dir,
+            mode="full",
+            enable_figma_export=False,
+        )
+
     assert first["stats"]["duplicates"] == 1
     assert second["stats"]["duplicates"] == 1
 
@@ -128,12 +134,10 @@ def test_ingest_is_idempotent_and_deduplicates_by_hash(tmp_path):
     assert len(raw_fig_files) == 1
 
 
-def test_ingest_creates_index_backups_on_second_run(tmp_path):
-    ingest_module = _load_ingest_module()
+def test_ingest_creates_index_backups_on_second_run(tmp_path, ingest_module):
     source_dir = tmp_path / "CompagnieDocs"
     target_dir = tmp_path / "assets" / "reference" / "compagnie_docs"
-    source_dir.mkdir(parents=True, exist_ok=True)
-    (source_dir / "Brand.fig").write_bytes(b"fig-content")
+    _write_sources(source_dir, {"Brand.fig": b"fig-content"})
 
     ingest_module.ingest_compagnie_docs(
         source_dir=source_dir,
@@ -151,3 +155,87 @@ def test_ingest_creates_index_backups_on_second_run(tmp_path):
     index_dir = target_dir / "index"
     assert list(index_dir.glob("corpus_index.json.bak-*"))
     assert list(index_dir.glob("corpus_index.md.bak-*"))
+
+
+def test_ingest_reuses_hashes_of_unchanged_sources(tmp_path, monkeypatch, ingest_module):
+    source_dir = tmp_path / "CompagnieDocs"
+    target_dir = tmp_path / "assets" / "reference" / "compagnie_docs"
+    _write_sources(source_dir, {"Brand.fig": b"fig-content", "Deck.fig": b"deck-v1"})
+    # Old enough that the cache trusts them on the next run.
+    an_hour_ago_ns = time.time_ns() - 3600 * 1_000_000_000
+    for path in source_dir.iterdir():
+        os.utime(path, ns=(an_hour_ago_ns, an_hour_ago_ns))
+
+    hashed: list[str] = []
+    real_sha256_file = ingest_module._sha256_file
+
+    def _recording_sha256_file(path: Path) -> str:
+        hashed.append(path.name)
+        return real_sha256_file(path)
+
+    monkeypatch.setattr(ingest_module, "_sha256_file", _recording_sha256_file)
+    stat_cache_path = tmp_path / "cache" / "stat_cache.json"
+
+    def _run() -> dict:
+        return ingest_module.ingest_compagnie_docs(
+            source_dir=source_dir,
+            target_dir=target_dir,
+            mode="full",
+            enable_figma_export=False,
+            stat_cache_path=stat_cache_path,
+        )
+
+    first = _run()
+    assert sorted(hashed) == ["Brand.fig", "Deck.fig"]
+
+    hashed.clear()
+    (source_dir / "Deck.fig").write_bytes(b"deck-v2-longer")
+    second = _run()
+
+    assert hashed == ["Deck.fig"]
+    first_hashes = {doc["original_name"]: doc["sha256"] for doc in first["documents"]}
+    second_hashes = {doc["original_name"]: doc["sha256"] for doc in second["documents"]}
+    assert second_hashes["Brand.fig"] == first_hashes["Brand.fig"]
+    assert second_hashes["Deck.fig"] != first_hashes["Deck.fig"]
+    assert stat_cache_path.exists()
+    assert not (target_dir / "index" / "stat_cache.json").exists()
+
+
+def test_ingest_rehashes_sources_modified_around_the_cache_write(tmp_path, ingest_module):
+    source_dir = tmp_path / "CompagnieDocs"
+    target_dir = tmp_path / "assets" / "reference" / "compagnie_docs"
+    deck_path = source_dir / "Deck.fig"
+    _write_sources(source_dir, {"Deck.fig": b"deck-v1"})
+    stat_cache_path = tmp_path / "cache" / "stat_cache.json"
+
+    def _run() -> dict:
+        return ingest_module.ingest_compagnie_docs(
+            source_dir=source_dir,
+            target_dir=target_dir,
+            mode="full",
+            enable_figma_export=False,
+            stat_cache_path=stat_cache_path,
+        )
+
+    _run()
+    # Same size and, as on a coarse-mtime filesystem, the same timestamp.
+    original_stat = deck_path.stat()
+    deck_path.write_bytes(b"deck-v2")
+    os.utime(deck_path, ns=(original_stat.st_atime_ns, original_stat.st_mtime_ns))
+    second = _run()
+
+    assert second["documents"][0]["sha256"] == hashlib.sha256(b"deck-v2").hexdigest()
+
+
+@pytest.mark.parametrize("size_delta", [-1, 0, 1, 1024 * 1024])
+def test_sha256_file_matches_hashlib_around_mmap_threshold(tmp_path, ingest_module, size_delta):
+    size = ingest_module.MMAP_HASH_MIN_BYTES + size_delta
+    data = bytes(index % 251 for index in range(size))
+    path = tmp_path / "payload.bin"
+    path.write_bytes(data)
+
+    with mock.patch.object(ingest_module.mmap, "mmap", wraps=ingest_module.mmap.mmap) as mmap_spy:
+        digest = ingest_module._sha256_file(path)
+
+    assert digest == hashlib.sha256(data).hexdigest()
+    assert mmap_spy.called is (size >= ingest_module.MMAP_HASH_MIN_BYTES)
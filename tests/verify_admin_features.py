@@ -1,26 +1,13 @@
-import requests
-import sys
-import uuid
-import time
+API_PREFIX = "/api/v1/admin"
 
-BASE_URL = "http://localhost:8000"
-AUTH = ("admin", "change-me")
+def _ok_json(response):
+    assert response.ok, f"{response.status_code}: {response.text}"
+    return response.json()
 
-def check(response, description):
-    if response.status_code >= 200 and response.status_code < 300:
-        print(f"✓ {description}")
-        return response.json()
-    else:
-        print(f"✗ {description} failed ({response.status_code}): {response.text}")
-        sys.exit(1)
+def test_account(live_session, live_server_url):
+    base = f"{live_server_url}{API_PREFIX}"
+    _ok_json(live_session.get(f"{base}/account"))
 
-def verify_account():
-    print("\n--- Testing Account API ---")
-    # Get Account
-    res = requests.get(f"{BASE_URL}/api/v1/admin/account", auth=AUTH)
-    data = check(res, "Get Account Profile")
-    
-    # Update Account
     payload = {
         "full_name": "Test Admin",
         "email": "admin@test.com",
@@ -28,68 +15,47 @@ def verify_account():
         "locale": "en-US",
         "timezone": "UTC"
     }
-    res = requests.put(f"{BASE_URL}/api/v1/admin/account", json=payload, auth=AUTH)
-    data = check(res, "Update Account Profile")
-    if data["full_name"] != "Test Admin":
-        print("✗ Account update mismatch")
-        sys.exit(1)
+    data = _ok_json(live_session.put(f"{base}/account", json=payload))
+    assert data["full_name"] == "Test Admin"
+
+def test_billing(live_session, live_server_url, unique_suffix):
+    base = f"{live_server_url}{API_PREFIX}"
+    _ok_json(live_session.get(f"{base}/billing"))
 
-def verify_billing():
-    print("\n--- Testing Billing API ---")
-    # Get Billing
-    res = requests.get(f"{BASE_URL}/api/v1/admin/billing", auth=AUTH)
-    data = check(res, "Get Billing Profile")
-    
-    # Update Billing Profile
     payload = {
         "plan_name": "Enterprise",
         "billing_email": "billing@test.com",
         "company_name": "Test Corp",
         "amount_cents": 19900
     }
-    res = requests.put(f"{BASE_URL}/api/v1/admin/billing", json=payload, auth=AUTH)
-    data = check(res, "Update Billing Profile")
-    if data["profile"]["plan_name"] != "Enterprise":
-        print("✗ Billing update mismatch")
-        sys.exit(1)
+    data = _ok_json(live_session.put(f"{base}/billing", json=payload))
+    assert data["profile"]["plan_name"] == "Enterprise"
 
-    # Create Invoice
-    invoice_num = f"INV-{str(uuid.uuid4())[:8]}"
     payload = {
-        "invoice_number": invoice_num,
+        "invoice_number": f"INV-{unique_suffix()}",
         "amount_cents": 5000,
         "status": "issued"
     }
-    res = requests.post(f"{BASE_URL}/api/v1/admin/billing/invoices", json=payload, auth=AUTH)
-    check(res, "Create Invoice")
+    _ok_json(live_session.post(f"{base}/billing/invoices", json=payload))
 
-def verify_notifications():
-    print("\n--- Testing Notifications API ---")
-    # Create Notification
+def test_notifications(live_session, live_server_url):
+    base = f"{live_server_url}{API_PREFIX}"
     payload = {
         "event_key": "task_created",
         "title": "Test Notification",
         "message": "This is a test",
         "channel": "in_app"
     }
-    res = requests.post(f"{BASE_URL}/api/v1/admin/notifications", json=payload, auth=AUTH)
-    data = check(res, "Create Notification")
+    data = _ok_json(live_session.post(f"{base}/notifications", json=payload))
     notif_id = data["items"][0]["id"]
-    
-    # List Notifications
-    res = requests.get(f"{BASE_URL}/api/v1/admin/notifications", auth=AUTH)
-    data = check(res, "List Notifications")
-    if not any(n["id"] == notif_id for n in data["items"]):
-        print("✗ Created notification not found in list")
-        sys.exit(1)
 
-    # Mark Read
-    res = requests.post(f"{BASE_URL}/api/v1/admin/notifications/mark-read", json={"ids": [notif_id]}, auth=AUTH)
-    check(res, "Mark Notification Read")
+    data = _ok_json(live_session.get(f"{base}/notifications"))
+    assert any(n["id"] == notif_id for n in data["items"])
+
+    _ok_json(live_session.post(f"{base}/notifications/mark-read", json={"ids": [notif_id]}))
 
-def verify_reports():
-    print("\n--- Testing Reports API ---")
-    # Create Schedule
+def test_reports(live_session, live_server_url):
+    base = f"{live_server_url}{API_PREFIX}"
     payload = {
         "name": "Test Report",
         "frequency": "weekly",
@@ -97,26 +63,10 @@ def verify_reports():
         "minute_local": 0,
         "recipients": ["test@example.com"]
     }
-    res = requests.post(f"{BASE_URL}/api/v1/admin/reports/schedules", json=payload, auth=AUTH)
-    data = check(res, "Create Report Schedule")
+    data = _ok_json(live_session.post(f"{base}/reports/schedules", json=payload))
     schedule_id = data["id"]
-    
-    # Run Due (simulate)
-    # We can't easily force run pending without hacking time, but we can call the endpoint
-    res = requests.post(f"{BASE_URL}/api/v1/admin/reports/schedules/run-due", auth=AUTH)
-    check(res, "Run Due Schedules")
-    
-    # Delete Schedule
-    res = requests.delete(f"{BASE_URL}/api/v1/admin/reports/schedules/{schedule_id}", auth=AUTH)
-    check(res, "Delete Report Schedule")
 
-if __name__ == "__main__":
-    try:
-        verify_account()
-        verify_billing()
-        verify_notifications()
-        verify_reports()
-        print("\nALL NEW BACKEND FEATURES PASSED")
-    except Exception as e:
-        print(f"\nERROR: {e}")
-        sys.exit(1)
+    # Due schedules cannot be forced without moving the clock, but the
+    # endpoint itself must answer.
+    _ok_json(live_session.post(f"{base}/reports/schedules/run-due"))
+    _ok_json(live_session.delete(f"{base}/reports/schedules/{schedule_id}"))